@@ -66,6 +66,8 @@ if DATABASE_URL:
             'PASSWORD': os.environ.get('PGPASSWORD', ''),
             'HOST': os.environ.get('PGHOST', 'localhost'),
             'PORT': os.environ.get('PGPORT', '5432'),
+            'CONN_MAX_AGE': int(os.environ.get('CONN_MAX_AGE', '60')),
+            'CONN_HEALTH_CHECKS': True,
         }
     }
 else: